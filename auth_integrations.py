@@ -298,11 +298,20 @@ class OAuthProviders:
 class AuthManager:
     """Unified authentication manager for all providers."""
     
-    def __init__(self):
+    def __init__(self, cloudinary: Optional[CloudinaryStorage] = None, oauth: Optional[OAuthProviders] = None):
+        # The Supabase client carries the signed-in user, so it is never shared between sessions
         self.supabase = SupabaseAuth()
-        self.cloudinary = CloudinaryStorage()
+        self.cloudinary = cloudinary or CloudinaryStorage()
         self.local_storage = LocalStorage()
-        self.oauth = OAuthProviders()
+        self.oauth = oauth or OAuthProviders()
+        
+        # Provider availability is settled at construction, so the status is built once
+        self._integration_status = {
+            "supabase": self.supabase.enabled,
+            "cloudinary": self.cloudinary.enabled,
+            "local_storage": True,  # Always available
+            "oauth": True  # UI always available
+        }
     
     def authenticate(self, email: str, password: str) -> Optional[Dict]:
         """Try authentication with available providers."""
@@ -314,7 +323,7 @@ class AuthManager:
                 return user
         
         # Fallback to demo users (development)
-        from app import DEMO_USERS, authenticate_user
+        from utils.auth_utils import authenticate_user
         return authenticate_user(email, password)
     
     def register(self, email: str, password: str, user_data: Dict) -> Optional[Dict]:
@@ -343,12 +352,19 @@ class AuthManager:
     
     def get_integration_status(self) -> Dict[str, bool]:
         """Get status of all integrations."""
-        return {
-            "supabase": self.supabase.enabled,
-            "cloudinary": self.cloudinary.enabled,
-            "local_storage": True,  # Always available
-            "oauth": True  # UI always available
-        }
+        return self._integration_status
+
+@st.cache_resource(show_spinner=False)
+def get_shared_integrations():
+    """Stateless integrations configured once per process: (cloudinary, oauth)."""
+    return CloudinaryStorage(), OAuthProviders()
+
+def get_auth_manager() -> AuthManager:
+    """Get this browser session's auth manager, built on the shared stateless integrations."""
+    if 'auth_manager' not in st.session_state:
+        cloudinary, oauth = get_shared_integrations()
+        st.session_state.auth_manager = AuthManager(cloudinary=cloudinary, oauth=oauth)
+    return st.session_state.auth_manager
 
 # =============================================================================
 # 6. STREAMLIT SECRETS CONFIGURATION
@@ -388,8 +404,8 @@ def show_secrets_template():
 def example_usage():
     """Example of how to use the unified auth manager."""
     
-    # Initialize auth manager
-    auth = AuthManager()
+    # Per-session auth manager
+    auth = get_auth_manager()
     
     # Check integration status
     status = auth.get_integration_status()
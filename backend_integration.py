@@ -12,6 +12,7 @@ Demonstrates:
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 from datetime import datetime, timedelta
@@ -32,7 +33,13 @@ class BackendClient:
         else:
             self.base_url = st.secrets.get("API_BASE_URL", "http://localhost:8081").rstrip("/")
         
+        self.health_url = f"{self.base_url}/health"
+        
+        # Single backend host: one keep-alive pool, sized for concurrent Streamlit sessions
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.session.headers.update({
             "Content-Type": "application/json",
             "User-Agent": "AstralytiQ-Frontend/2.0.0"
@@ -67,7 +74,8 @@ class BackendClient:
     def health_check(self) -> Dict[str, Any]:
         """Check backend health status."""
         try:
-            response = self.session.get(f"{self.base_url}/health", timeout=5)
+            # Short connect timeout: an unreachable backend fails fast, a slow one still gets 5s to answer
+            response = self.session.get(self.health_url, timeout=(0.5, 5))
             return self._handle_response(response)
         except Exception as e:
             return {"status": "unhealthy", "error": str(e)}
@@ -235,6 +243,11 @@ def check_backend_connection() -> bool:
     health = client.health_check()
     return health.get("status") == "healthy"
 
+@st.cache_data(ttl=10, show_spinner=False)  # Cache for 10 seconds
+def get_cached_backend_status() -> bool:
+    """Check backend availability with caching."""
+    return check_backend_connection()
+
 def authenticate_user(email: str, password: str) -> bool:
     """Authenticate user with backend."""
     client = get_backend_client()
@@ -278,6 +291,17 @@ def logout_user():
         if key in st.session_state:
             del st.session_state[key]
 
+def format_money(value: Any) -> str:
+    """Normalize a currency figure from the API to a '$'-prefixed display string ('—' when missing)."""
+    # bool is an int subclass but not an amount, so it gets the placeholder too
+    if value is None or isinstance(value, bool):
+        return "—"
+    # Whole dollars, matching the demo KPI ("$123,456")
+    if isinstance(value, (int, float)):
+        return f"${value:,.0f}"
+    value = str(value)
+    return value if value.startswith("$") else f"${value}"
+
 @st.cache_data(ttl=60)  # Cache for 1 minute
 def get_cached_datasets() -> List[Dict[str, Any]]:
     """Get datasets with caching."""
@@ -303,7 +327,10 @@ def get_cached_metrics() -> Dict[str, Any]:
         return {}
     
     client = get_backend_client()
-    return client.get_metrics()
+    metrics = client.get_metrics()
+    if "cost_savings" in metrics:
+        metrics["cost_savings"] = format_money(metrics["cost_savings"])
+    return metrics
 
 def show_backend_status():
     """Show backend connection status in sidebar."""
@@ -409,12 +436,11 @@ Or use Demo Mode for offline access
 # Real-time data refresh
 def setup_auto_refresh():
     """Setup auto-refresh for real-time data."""
-    if "last_refresh" not in st.session_state:
-        st.session_state.last_refresh = datetime.now()
+    now = datetime.now()
     
     # Auto-refresh every 30 seconds
-    if datetime.now() - st.session_state.last_refresh > timedelta(seconds=30):
-        st.session_state.last_refresh = datetime.now()
+    if now - st.session_state.setdefault("last_refresh", now) > timedelta(seconds=30):
+        st.session_state.last_refresh = now
         
         # Clear cached data to force refresh
         get_cached_datasets.clear()
@@ -128,10 +128,8 @@ def show_user_profile(user):
     st.sidebar.markdown(f"**Level:** {user['level']}")
     
     # Session info
-    if 'login_time' not in st.session_state:
-        st.session_state.login_time = datetime.now()
-    
-    session_duration = datetime.now() - st.session_state.login_time
+    now = datetime.now()
+    session_duration = now - st.session_state.setdefault('login_time', now)
     hours, remainder = divmod(int(session_duration.total_seconds()), 3600)
     minutes, _ = divmod(remainder, 60)
     st.sidebar.markdown(f"**Session:** {hours}h {minutes}m")
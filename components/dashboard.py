@@ -4,11 +4,55 @@ Main dashboard and analytics components
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import numpy as np
+from utils.data_generator import demo_columns_frame
 
+# Overview metric cards: (label, metrics key, delta, delta color)
+METRIC_CARDS = (
+    ("Datasets", 'total_datasets', "+3 this week", "normal"),
+    ("Active Models", 'active_models', "+2 deployed", "normal"),
+    ("Dashboards", 'total_dashboards', "All active", "off"),
+    ("Data Processed", 'data_processed', "+15% this month", "normal")
+)
+
+# Recent activity feed (static demo entries) and its icon per activity type
+ACTIVITY_ICONS = {"success": "✅", "info": "ℹ️"}
+RECENT_ACTIVITIES = (
+    {"time": "2 minutes ago", "action": "Model 'Sales Predictor' deployed successfully", "type": "success"},
+    {"time": "15 minutes ago", "action": "Dataset 'Customer Data Q4' uploaded", "type": "info"},
+    {"time": "1 hour ago", "action": "Dashboard 'Revenue Analytics' updated", "type": "info"},
+    {"time": "3 hours ago", "action": "Training job completed for 'Churn Model'", "type": "success"},
+    {"time": "5 hours ago", "action": "New user 'john.doe@company.com' registered", "type": "info"}
+)
+
+@st.cache_resource(show_spinner=False)
+def model_performance_figure(model_ids, _model_df):
+    """Model accuracy bar chart, memoized on the model ids."""
+    import plotly.express as px
+    fig = px.bar(
+        _model_df, 
+        x='name', 
+        y='accuracy',
+        color='type',
+        title="Model Performance Overview",
+        labels={'accuracy': 'Accuracy Score', 'name': 'Model Name'}
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def dataset_types_figure(dataset_ids, _dataset_df):
+    """Dataset type pie chart, memoized on the dataset ids."""
+    import plotly.express as px
+    fig = px.pie(
+        _dataset_df,
+        names='type',
+        title="Dataset Types Distribution",
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@st.fragment
 def show_dashboard(demo_data):
     """Show the main dashboard with metrics and overview."""
     st.header("Platform Overview")
@@ -16,43 +60,8 @@ def show_dashboard(demo_data):
     metrics = demo_data['metrics']
     
     # Key metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>Datasets</h3>
-            <h2>{metrics['total_datasets']}</h2>
-            <p>↗️ +3 this week</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>Active Models</h3>
-            <h2>{metrics['active_models']}</h2>
-            <p>🚀 +2 deployed</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>Dashboards</h3>
-            <h2>{metrics['total_dashboards']}</h2>
-            <p>📊 All active</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>Data Processed</h3>
-            <h2>{metrics['data_processed']}</h2>
-            <p>📈 +15% this month</p>
-        </div>
-        """, unsafe_allow_html=True)
+    for col, (label, key, delta, delta_color) in zip(st.columns(4), METRIC_CARDS):
+        col.metric(label, metrics[key], delta, delta_color=delta_color)
     
     # Charts section
     st.subheader("Platform Analytics")
@@ -62,48 +71,27 @@ def show_dashboard(demo_data):
     with col1:
         # Model performance chart
         models = demo_data['models']
-        model_df = pd.DataFrame(models)
-        
-        fig = px.bar(
-            model_df, 
-            x='name', 
-            y='accuracy',
-            color='type',
-            title="Model Performance Overview",
-            labels={'accuracy': 'Accuracy Score', 'name': 'Model Name'}
-        )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        model_ids = tuple(m['id'] for m in models)
+        model_df = demo_columns_frame('models', model_ids, demo_data['columns']['models'])
+        st.plotly_chart(model_performance_figure(model_ids, model_df), use_container_width=True)
     
     with col2:
         # Dataset distribution
         datasets = demo_data['datasets']
-        dataset_df = pd.DataFrame(datasets)
-        
-        fig = px.pie(
-            dataset_df,
-            names='type',
-            title="Dataset Types Distribution",
-            color_discrete_sequence=px.colors.qualitative.Set3
-        )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        dataset_ids = tuple(d['id'] for d in datasets)
+        dataset_df = demo_columns_frame('datasets', dataset_ids, demo_data['columns']['datasets'])
+        st.plotly_chart(dataset_types_figure(dataset_ids, dataset_df), use_container_width=True)
     
     # Recent activity
     st.subheader("Recent Activity")
     
-    activities = [
-        {"time": "2 minutes ago", "action": "Model 'Sales Predictor' deployed successfully", "type": "success"},
-        {"time": "15 minutes ago", "action": "Dataset 'Customer Data Q4' uploaded", "type": "info"},
-        {"time": "1 hour ago", "action": "Dashboard 'Revenue Analytics' updated", "type": "info"},
-        {"time": "3 hours ago", "action": "Training job completed for 'Churn Model'", "type": "success"},
-        {"time": "5 hours ago", "action": "New user 'john.doe@company.com' registered", "type": "info"}
-    ]
-    
-    for activity in activities:
-        icon = "✅" if activity["type"] == "success" else "ℹ️"
-        st.markdown(f"{icon} **{activity['time']}** - {activity['action']}")
+    # One markdown element for the whole feed instead of one per activity
+    st.markdown("\n\n".join(
+        f"{ACTIVITY_ICONS.get(activity['type'], 'ℹ️')} **{activity['time']}** - {activity['action']}"
+        for activity in RECENT_ACTIVITIES
+    ))
 
+@st.fragment
 def show_analytics(demo_data):
     """Show analytics and reporting interface."""
     st.header("Analytics & Reporting")
@@ -5,8 +5,58 @@ Data upload, processing, and management interfaces
 
 import streamlit as st
 import pandas as pd
-import time
+from utils.data_generator import demo_columns_frame
 
+# Rows parsed for the upload preview; the full file is never loaded into a DataFrame
+PREVIEW_ROWS = 1000
+
+# Processing pipeline options
+CLEANING_OPTIONS = ("Remove duplicates", "Handle missing values", "Normalize data types", "Validate data quality")
+TRANSFORM_OPTIONS = ("Feature scaling", "Encoding categorical variables", "Feature engineering", "Data aggregation")
+PIPELINE_STEPS = ("Validating data", "Cleaning records", "Applying transformations", "Quality checks", "Finalizing")
+
+# Columns shown in the datasets table
+DATASET_TABLE_COLUMNS = ['name', 'type', 'size', 'rows', 'columns', 'status', 'created']
+
+def csv_preview(uploaded_file):
+    """First PREVIEW_ROWS rows of an uploaded CSV (first Arrow batch) and its approximate data row count."""
+    uploaded_file.seek(0)
+    try:
+        import pyarrow.csv as pacsv
+        batch = pacsv.open_csv(uploaded_file).read_next_batch()
+        preview_df = batch.slice(0, PREVIEW_ROWS).to_pandas()
+    except Exception:
+        # Header-only files or input pyarrow rejects fall back to a bounded pandas read
+        uploaded_file.seek(0)
+        preview_df = pd.read_csv(uploaded_file, nrows=PREVIEW_ROWS)
+    
+    # Estimate data rows from line breaks instead of parsing every row
+    # (quoted multi-line fields and bare-\r line endings make this approximate)
+    raw = uploaded_file.getvalue()
+    row_count = raw.count(b"\n") + (not raw.endswith(b"\n")) - 1
+    uploaded_file.seek(0)
+    return preview_df, row_count
+
+def parquet_preview(uploaded_file):
+    """First row group (capped at PREVIEW_ROWS) and metadata row count of an uploaded Parquet file, or None if unreadable."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    uploaded_file.seek(0)
+    try:
+        parquet_file = pq.ParquetFile(uploaded_file)
+        if parquet_file.num_row_groups:
+            first_group = parquet_file.read_row_group(0)
+        else:
+            first_group = parquet_file.schema_arrow.empty_table()
+        preview_df = first_group.slice(0, PREVIEW_ROWS).to_pandas()
+    except pa.ArrowException as e:
+        st.warning(f"⚠️ Could not read '{uploaded_file.name}' as Parquet: {e}")
+        return None
+    finally:
+        uploaded_file.seek(0)
+    return preview_df, parquet_file.metadata.num_rows
+
+@st.fragment
 def show_data_management(demo_data, auth_manager=None):
     """Show data management interface."""
     st.header("Data Management")
@@ -17,7 +67,7 @@ def show_data_management(demo_data, auth_manager=None):
         st.subheader("Your Datasets")
         
         datasets = demo_data['datasets']
-        dataset_df = pd.DataFrame(datasets)
+        dataset_df = demo_columns_frame('datasets', tuple(d['id'] for d in datasets), demo_data['columns']['datasets'])
         
         # Search and filter
         col1, col2 = st.columns([3, 1])
@@ -26,16 +76,25 @@ def show_data_management(demo_data, auth_manager=None):
         with col2:
             status_filter = st.selectbox("Filter by status", ["All", "Active", "Processing", "Archived"])
         
-        # Filter datasets
-        filtered_df = dataset_df.copy()
-        if search_term:
-            filtered_df = filtered_df[filtered_df['name'].str.contains(search_term, case=False)]
-        if status_filter != "All":
-            filtered_df = filtered_df[filtered_df['status'] == status_filter]
+        # Filter the record list in Python, then take the matching rows from the cached frame
+        term = search_term.lower()
+        matches = [
+            i for i, d in enumerate(datasets)
+            if term in d['name'].lower() and (status_filter == "All" or d['status'] == status_filter)
+        ]
+        filtered_df = dataset_df.iloc[matches]
+        
+        # One table for all datasets, details only for the selected one
+        st.dataframe(
+            filtered_df[DATASET_TABLE_COLUMNS],
+            use_container_width=True,
+            hide_index=True
+        )
         
-        # Display datasets
-        for _, dataset in filtered_df.iterrows():
-            with st.expander(f"{dataset['name']} ({dataset['type']})"):
+        if not filtered_df.empty:
+            selected = st.selectbox("View details for:", filtered_df.index, format_func=filtered_df['name'].get)
+            dataset = filtered_df.loc[selected]
+            with st.expander(f"{dataset['name']} ({dataset['type']})", expanded=True):
                 col1, col2, col3 = st.columns(3)
                 with col1:
                     st.metric("Size", dataset['size'])
@@ -80,35 +139,49 @@ def show_data_management(demo_data, auth_manager=None):
                     st.success(f"File '{uploaded_file.name}' uploaded successfully!")
                 
                 # Show preview
+                preview = None
+                rows_label = "Rows"
                 if uploaded_file.type == "text/csv":
-                    df = pd.read_csv(uploaded_file)
+                    preview = csv_preview(uploaded_file)
+                    rows_label = "Rows (approx.)"
+                elif uploaded_file.name.lower().endswith(".parquet"):
+                    preview = parquet_preview(uploaded_file)
+                
+                if preview is not None:
+                    preview_df, row_count = preview
                     st.subheader("Data Preview")
-                    st.dataframe(df.head())
+                    st.dataframe(preview_df.head())
                     
                     col1, col2 = st.columns(2)
                     with col1:
-                        st.metric("Rows", len(df))
+                        st.metric(rows_label, f"{row_count:,}")
                     with col2:
-                        st.metric("Columns", len(df.columns))
+                        st.metric("Columns", len(preview_df.columns))
         
         elif upload_method == "URL Import":
-            url = st.text_input("Enter data URL:", placeholder="https://example.com/data.csv")
-            if url and st.button("Import from URL"):
+            with st.form("url_import_form"):
+                url = st.text_input("Enter data URL:", placeholder="https://example.com/data.csv")
+                import_clicked = st.form_submit_button("Import from URL")
+            if import_clicked and url:
                 st.success("Data imported successfully from URL!")
         
         else:  # Database Connection
-            col1, col2 = st.columns(2)
-            with col1:
-                db_type = st.selectbox("Database Type", ["PostgreSQL", "MySQL", "MongoDB", "SQLite"])
-                host = st.text_input("Host", placeholder="localhost")
-            with col2:
-                port = st.text_input("Port", placeholder="5432")
-                database = st.text_input("Database Name")
-            
-            username = st.text_input("Username")
-            password = st.text_input("Password", type="password")
+            # Connection fields only submit together, not one rerun per keystroke
+            with st.form("db_connection_form"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    db_type = st.selectbox("Database Type", ["PostgreSQL", "MySQL", "MongoDB", "SQLite"])
+                    host = st.text_input("Host", placeholder="localhost")
+                with col2:
+                    port = st.text_input("Port", placeholder="5432")
+                    database = st.text_input("Database Name")
+                
+                username = st.text_input("Username")
+                password = st.text_input("Password", type="password")
+                
+                test_clicked = st.form_submit_button("Test Connection")
             
-            if st.button("Test Connection"):
+            if test_clicked:
                 st.success("Connection successful!")
     
     with tab3:
@@ -122,30 +195,19 @@ def show_data_management(demo_data, auth_manager=None):
         """, unsafe_allow_html=True)
         
         # Processing options
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("**Data Cleaning Options:**")
-            st.checkbox("Remove duplicates")
-            st.checkbox("Handle missing values")
-            st.checkbox("Normalize data types")
-            st.checkbox("Validate data quality")
-        
-        with col2:
-            st.markdown("**Transformation Options:**")
-            st.checkbox("Feature scaling")
-            st.checkbox("Encoding categorical variables")
-            st.checkbox("Feature engineering")
-            st.checkbox("Data aggregation")
-        
-        if st.button("Start Processing Pipeline"):
-            progress_bar = st.progress(0)
-            status_text = st.empty()
+        with st.form("processing_pipeline_form"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                cleaning_steps = st.multiselect("Data Cleaning Options:", CLEANING_OPTIONS)
             
-            steps = ["Validating data", "Cleaning records", "Applying transformations", "Quality checks", "Finalizing"]
-            for i, step in enumerate(steps):
-                status_text.text(f"Processing: {step}...")
-                progress_bar.progress((i + 1) / len(steps))
-                time.sleep(0.5)
+            with col2:
+                transform_steps = st.multiselect("Transformation Options:", TRANSFORM_OPTIONS)
+            
+            start_clicked = st.form_submit_button("Start Processing Pipeline")
+        
+        if start_clicked:
+            # Simulated pipeline: report the steps without holding the script thread
+            st.progress(1.0, text=" → ".join(PIPELINE_STEPS))
             
-            st.success("✅ Data processing completed successfully!")
\ No newline at end of file
+            st.success(f"✅ Data processing completed successfully! ({len(cleaning_steps) + len(transform_steps)} options applied)")
\ No newline at end of file
@@ -7,12 +7,33 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import time
-import requests
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from backend_integration import get_backend_client
 
 
+# Model registry actions and their handlers
+MODEL_ACTION_HANDLERS = {
+    "View Details": lambda model: st.info(f"Opening detailed view for {model['name']}"),
+    "Deploy": lambda model: st.success(f"Deploying {model['name']}..."),
+    "Compare": lambda model: st.info("Opening model comparison tool...")
+}
+MODEL_ACTIONS = tuple(MODEL_ACTION_HANDLERS)
+MODEL_ACTIONS_NO_DEPLOY = tuple(a for a in MODEL_ACTIONS if a != "Deploy")
+
+# Model registry filter and sort choices
+STATUS_FILTER_OPTIONS = ("All", "Training", "Deployed", "Failed", "Completed")
+SORT_OPTIONS = ("Name", "Accuracy", "Created Date")
+
+# Simulated training pipeline steps
+TRAINING_STEPS = ("Uploading data", "Validating data", "Training Prophet model", "Evaluating performance", "Finalizing model")
+
+# Active deployments table formatting
+DEPLOYMENT_COLUMN_CONFIG = {
+    "Accuracy": st.column_config.NumberColumn(format="%.2f%%"),
+    "Requests/day": st.column_config.NumberColumn(format="%d"),
+    "Avg Response": st.column_config.NumberColumn(format="%d ms")
+}
+
+
+@st.fragment
 def show_ml_studio(demo_data, user_level):
     """Show ML Studio interface with real forecasting capabilities."""
     st.header("ML Studio")
@@ -30,13 +51,33 @@ def show_ml_studio(demo_data, user_level):
     with tab2:
         show_model_registry_tab(demo_data)
     
+    # Tab bodies all run on every rerun, so the less used ones load on demand;
+    # each body is its own fragment, so interacting with one reruns only that tab
     with tab3:
-        show_deployment_tab(demo_data)
+        show_lazy_tab("ml_deployments_loaded", "🚀 Load Deployments", show_deployment_tab, demo_data)
     
     with tab4:
-        show_monitoring_tab()
+        show_lazy_tab("ml_monitoring_loaded", "📈 Load Monitoring", show_monitoring_tab)
+
 
+def session_rng():
+    """This session's PCG64 generator (simulated metrics never touch numpy's global RNG)."""
+    if 'ml_studio_rng' not in st.session_state:
+        st.session_state.ml_studio_rng = np.random.default_rng()
+    return st.session_state.ml_studio_rng
 
+
+def show_lazy_tab(state_key, label, render, *args):
+    """Render a tab body only after the user has opened it once this session."""
+    if not st.session_state.get(state_key):
+        if not st.button(label, key=f"{state_key}_button"):
+            return
+        st.session_state[state_key] = True
+    
+    render(*args)
+
+
+@st.fragment
 def show_forecast_training_tab():
     """Enhanced training tab with real forecast capabilities."""
     st.subheader("Train Sales Forecasting Model")
@@ -132,9 +173,11 @@ def show_forecast_training_tab():
                 with col4:
                     st.metric("Max Value", f"{values.max():.2f}")
                 
-                # Chart preview
+                # Chart preview (plotly is only loaded once a preview is drawn)
+                import plotly.graph_objects as go
+                # WebGL trace: uploaded history can run to many thousands of points
                 fig = go.Figure()
-                fig.add_trace(go.Scatter(
+                fig.add_trace(go.Scattergl(
                     x=dates,
                     y=values,
                     mode='lines',
@@ -180,6 +223,7 @@ def train_forecast_model(uploaded_file, date_column, value_column, forecast_peri
     
     with st.spinner("🚀 Uploading data..."):
         try:
+            from backend_integration import get_backend_client
             client = get_backend_client()
             
             # Get auth token
@@ -309,6 +353,8 @@ def train_forecast_model(uploaded_file, date_column, value_column, forecast_peri
 def show_forecast_visualization(model_id, periods):
     """Display forecast visualization."""
     try:
+        from backend_integration import get_backend_client
+        import plotly.graph_objects as go
         client = get_backend_client()
         forecast_data = client.get_forecast(model_id)
         
@@ -322,8 +368,8 @@ def show_forecast_visualization(model_id, periods):
             # Create forecast chart
             fig = go.Figure()
             
-            # Forecast line
-            fig.add_trace(go.Scatter(
+            # Forecast line (WebGL, long horizons stay responsive)
+            fig.add_trace(go.Scattergl(
                 x=dates,
                 y=values,
                 mode='lines',
@@ -372,21 +418,8 @@ def simulate_training():
     """Simulate training for demo mode."""
     st.info("🎭 Running in simulation mode (backend not connected)")
     
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    
-    training_steps = [
-        ("Uploading data...", 20),
-        ("Validating data...", 40),
-        ("Training Prophet model...", 70),
-        ("Evaluating performance...", 90),
-        ("Finalizing model...", 100)
-    ]
-    
-    for step, progress in training_steps:
-        status_text.text(step)
-        progress_bar.progress(progress / 100)
-        time.sleep(0.8)
+    # Report the simulated steps without holding the script thread
+    st.progress(1.0, text=" → ".join(TRAINING_STEPS))
     
     st.success("✅ Model training completed! (Simulated)")
     
@@ -402,25 +435,25 @@ def simulate_training():
         st.metric("MAPE", "8.3%")
 
 
+@st.fragment
 def show_model_registry_tab(demo_data):
     """Show model registry with enhanced filtering."""
     st.subheader("Model Registry")
     
-    models = demo_data['models']
-    
     # Model filters
     col1, col2, col3 = st.columns(3)
     with col1:
-        type_filter = st.selectbox("Filter by type", ["All"] + list(set([m['type'] for m in models])))
+        type_filter = st.selectbox("Filter by type", ["All", *demo_data['precomputed']['model_types_sorted']])
     with col2:
-        status_filter = st.selectbox("Filter by status", ["All", "Training", "Deployed", "Failed", "Completed"])
+        status_filter = st.selectbox("Filter by status", STATUS_FILTER_OPTIONS)
     with col3:
-        sort_by = st.selectbox("Sort by", ["Name", "Accuracy", "Created Date"])
+        sort_by = st.selectbox("Sort by", SORT_OPTIONS)
     
-    # Display models
+    # Display models (status partitions are precomputed with the demo data)
+    models = demo_data['models'] if status_filter == "All" else \
+        demo_data['precomputed']['models_by_status'].get(status_filter, [])
     for model in models:
-        if (type_filter == "All" or model['type'] == type_filter) and \
-           (status_filter == "All" or model['status'] == status_filter):
+        if type_filter == "All" or model['type'] == type_filter:
             
             with st.expander(f"{model['name']} ({model['type']})"):
                 col1, col2, col3, col4 = st.columns(4)
@@ -434,52 +467,77 @@ def show_model_registry_tab(demo_data):
                 with col4:
                     st.metric("Created", model['created'].strftime("%Y-%m-%d"))
                 
-                # Action buttons
-                button_col1, button_col2, button_col3 = st.columns(3)
-                with button_col1:
-                    if st.button("View Details", key=f"details_{model['id']}"):
-                        st.info(f"Opening detailed view for {model['name']}")
-                with button_col2:
-                    if model['status'] == 'Completed' and st.button("Deploy", key=f"deploy_{model['id']}"):
-                        st.success(f"Deploying {model['name']}...")
-                with button_col3:
-                    if st.button("Compare", key=f"compare_{model['id']}"):
-                        st.info("Opening model comparison tool...")
+                # Actions (one widget per model instead of a button per action)
+                actions = MODEL_ACTIONS if model['status'] == 'Completed' else MODEL_ACTIONS_NO_DEPLOY
+                key = f"actions_{model['id']}"
+                st.segmented_control(
+                    "Actions",
+                    options=actions,
+                    selection_mode="single",
+                    default=None,
+                    key=key,
+                    on_change=queue_model_action,
+                    args=(key,),
+                    label_visibility="collapsed"
+                )
+                if st.session_state.get('model_action_key') == key:
+                    MODEL_ACTION_HANDLERS[st.session_state.pop('model_action')](model)
+                    del st.session_state.model_action_key
+
 
+def queue_model_action(key):
+    """Move the clicked registry action out of its control so it runs exactly once."""
+    st.session_state.model_action = st.session_state[key]
+    st.session_state.model_action_key = key if st.session_state[key] else None
+    st.session_state[key] = None
 
+
+@st.fragment
 def show_deployment_tab(demo_data):
     """Show deployment tab."""
     st.subheader("Model Deployment")
     
-    deployed_models = [m for m in demo_data['models'] if m['status'] == 'Deployed']
+    deployed_models = demo_data['precomputed']['models_by_status']['Deployed']
     
     if deployed_models:
         st.markdown("### Active Deployments")
         
-        for model in deployed_models:
-            with st.container():
-                col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
-                
-                with col1:
-                    st.markdown(f"**{model['name']}**")
-                    st.caption(f"{model['type']} • Accuracy: {model['accuracy']:.2%}")
-                
-                with col2:
-                    st.metric("Requests/day", f"{np.random.randint(100, 1000)}")
-                
-                with col3:
-                    st.metric("Avg Response", f"{np.random.randint(50, 200)}ms")
-                
-                with col4:
-                    if st.button("Manage", key=f"manage_{model['id']}"):
-                        st.info(f"Opening management panel for {model['name']}")
-                
-                st.divider()
+        # Simulated traffic: one vectorized draw per session, so values don't flicker on reruns
+        if 'deployment_traffic' not in st.session_state:
+            rng = session_rng()
+            st.session_state.deployment_traffic = (
+                rng.integers(100, 1000, len(deployed_models)),
+                rng.integers(50, 200, len(deployed_models))
+            )
+        requests_per_day, avg_response = st.session_state.deployment_traffic
+        
+        # One table for all deployments instead of a row of widgets per model
+        deployments_df = pd.DataFrame({
+            'Name': [model['name'] for model in deployed_models],
+            'Type': [model['type'] for model in deployed_models],
+            'Accuracy': [model['accuracy'] * 100 for model in deployed_models],
+            'Requests/day': requests_per_day,
+            'Avg Response': avg_response
+        })
+        st.dataframe(
+            deployments_df,
+            column_config=DEPLOYMENT_COLUMN_CONFIG,
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        col1, col2 = st.columns([3, 1], vertical_alignment="bottom")
+        with col1:
+            selected = st.selectbox("Deployment", deployments_df.index, format_func=deployments_df['Name'].get)
+        with col2:
+            if st.button("Manage", key="manage_deployment"):
+                st.info(f"Opening management panel for {deployed_models[selected]['name']}")
     
     else:
         st.info("No models currently deployed. Train and deploy a model from the Model Registry.")
 
 
+@st.fragment
 def show_monitoring_tab():
     """Show monitoring tab."""
     st.subheader("Model Monitoring")
@@ -0,0 +1,77 @@
+"""
+Tests for demo password hashing and authentication in utils.auth_utils.
+"""
+
+import re
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils import auth_utils
+from utils.auth_utils import authenticate_user, hash_password, register_user
+
+
+@pytest.fixture
+def demo_mode(monkeypatch):
+    """Run with DEMO_MODE set to "true" and a private copy of DEMO_USERS."""
+    monkeypatch.setattr(auth_utils.st, "secrets", {"DEMO_MODE": "true"})
+    monkeypatch.setattr(auth_utils, "DEMO_USERS", dict(auth_utils.DEMO_USERS))
+
+
+def test_correct_password_authenticates(demo_mode):
+    """The demo account logs in with its password."""
+    user = authenticate_user("demo@astralytiq.com", "demo123")
+    assert user is not None
+    assert user["name"] == "Demo User"
+
+
+def test_wrong_password_rejected(demo_mode):
+    """A wrong password or unknown email does not log in."""
+    assert authenticate_user("demo@astralytiq.com", "wrong") is None
+    assert authenticate_user("nobody@astralytiq.com", "demo123") is None
+
+
+def test_registered_user_can_log_in(demo_mode):
+    """A user registered without a production backend can then authenticate."""
+    user = register_user("New User", "new@company.com", "s3cret!", "Analyst", "Beginner")
+    assert user is not None
+    assert "s3cret!" not in user.values()
+
+    assert authenticate_user("new@company.com", "s3cret!")["name"] == "New User"
+    assert authenticate_user("new@company.com", "wrong") is None
+    assert register_user("Again", "new@company.com", "other", "Analyst", "Beginner") is None
+
+
+def test_demo_mode_skips_production_auth(demo_mode):
+    """In demo mode the auth manager is never consulted."""
+    auth_manager = Mock()
+    assert authenticate_user("demo@astralytiq.com", "demo123", auth_manager) is not None
+    auth_manager.authenticate.assert_not_called()
+
+
+def test_production_auth_used_outside_demo_mode(demo_mode, monkeypatch):
+    """With DEMO_MODE off the auth manager is tried first."""
+    monkeypatch.setattr(auth_utils.st, "secrets", {"DEMO_MODE": "false"})
+    auth_manager = Mock()
+    auth_manager.authenticate.return_value = {"name": "Production User"}
+    assert authenticate_user("someone@company.com", "pw", auth_manager)["name"] == "Production User"
+    auth_manager.authenticate.assert_called_once_with("someone@company.com", "pw")
+
+
+@pytest.mark.parametrize("email,password", [
+    ("admin@astralytiq.com", "admin123"),
+    ("data.scientist@astralytiq.com", "ds123"),
+    ("analyst@astralytiq.com", "analyst123"),
+])
+def test_app_enterprise_digests_match_hash_password(email, password):
+    """The digests hard-coded in app.py are hash_password digests of the documented passwords."""
+    content = (project_root / "app.py").read_text(encoding="utf-16")
+    match = re.search(re.escape(f'"{email}"') + r':\s*\{\s*"password_hash":\s*"([0-9a-f]+)"', content)
+    assert match, f"No password_hash entry for {email} in app.py"
+    assert match.group(1) == hash_password(password)
@@ -3,31 +3,47 @@
 Helper functions for user authentication and management
 """
 
+import hashlib
+import hmac
 import streamlit as st
 from typing import Dict, Optional
 
-# Simple user database (in production, use Supabase/database)
+# Key for password digests (keyed BLAKE2b, so digests don't match a plain hash of the password)
+_SALT = b"astralytiq"
+
+def hash_password(password: str) -> str:
+    """Hash a password with BLAKE2b keyed by _SALT (16-byte digest, hex encoded)."""
+    return hashlib.blake2b(password.encode(), digest_size=16, key=_SALT).hexdigest()
+
+# Simple user database (in production, use Supabase/database); passwords are stored as hash_password digests
 DEMO_USERS = {
     "demo@astralytiq.com": {
-        "password": "demo123",
+        "password_hash": hash_password("demo123"),
         "name": "Demo User",
         "role": "Admin",
         "level": "Advanced"
     },
     "john@company.com": {
-        "password": "password123",
+        "password_hash": hash_password("password123"),
         "name": "John Doe",
         "role": "Data Scientist",
         "level": "Intermediate"
     },
     "jane@company.com": {
-        "password": "password123",
+        "password_hash": hash_password("password123"),
         "name": "Jane Smith",
         "role": "Analyst",
         "level": "Beginner"
     }
 }
 
+# Demo account per experience level (unknown levels get the admin demo account)
+DEMO_USER_BY_LEVEL = {
+    'Beginner': "jane@company.com",
+    'Intermediate': "john@company.com",
+    'Advanced': "demo@astralytiq.com"
+}
+
 def register_user(name, email, password, role, level, auth_manager=None):
     """Enhanced user registration function with production integration."""
     
@@ -48,7 +64,7 @@ def register_user(name, email, password, role, level, auth_manager=None):
     # Fallback to demo registration (add to DEMO_USERS)
     if email not in DEMO_USERS:
         DEMO_USERS[email] = {
-            "password": password,
+            "password_hash": hash_password(password),
             "name": name,
             "role": role,
             "level": level
@@ -59,9 +75,10 @@ def register_user(name, email, password, role, level, auth_manager=None):
 
 def authenticate_user(email, password, auth_manager=None):
     """Enhanced authentication function with production integration."""
+    demo_mode = st.secrets.get("DEMO_MODE", "true").lower() == "true"
     
-    # Try production authentication first
-    if auth_manager and hasattr(auth_manager, 'authenticate'):
+    # Try production authentication first (skipped in demo mode)
+    if not demo_mode and auth_manager and hasattr(auth_manager, 'authenticate'):
         try:
             user = auth_manager.authenticate(email, password)
             if user:
@@ -69,20 +86,15 @@ def authenticate_user(email, password, auth_manager=None):
         except Exception as e:
             st.error(f"⚠️ Production auth error: {str(e)}")
     
-    # Fallback to demo users
-    if email in DEMO_USERS and DEMO_USERS[email]["password"] == password:
-        return DEMO_USERS[email]
+    # Fallback to demo users (constant-time digest comparison)
+    user = DEMO_USERS.get(email)
+    if user and hmac.compare_digest(user["password_hash"], hash_password(password)):
+        return user
     return None
 
 def get_demo_user(level: str) -> Dict:
     """Get demo user by experience level."""
-    demo_mapping = {
-        'Beginner': "jane@company.com",
-        'Intermediate': "john@company.com", 
-        'Advanced': "demo@astralytiq.com"
-    }
-    
-    email = demo_mapping.get(level, "demo@astralytiq.com")
+    email = DEMO_USER_BY_LEVEL.get(level, "demo@astralytiq.com")
     user = DEMO_USERS[email].copy()
     user['email'] = email
     return user
@@ -5,62 +5,109 @@ Generate demo data for the platform
 
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+import streamlit as st
+from datetime import datetime
+from functools import partial
 
+# Categorical labels; weighted draws use cumulative probability thresholds (last bucket implied)
+FILE_TYPES = np.array(['CSV', 'JSON', 'Parquet', 'Excel'])
+DATASET_STATUSES = np.array(['Active', 'Processing', 'Archived'])
+DATASET_STATUS_THRESHOLDS = np.array([0.7, 0.9])
+MODEL_TYPES = np.array(['Classification', 'Regression', 'Clustering', 'Deep Learning', 'Time Series'])
+MODEL_STATUSES = np.array(['Training', 'Deployed', 'Failed', 'Completed'])
+MODEL_STATUS_THRESHOLDS = np.array([0.2, 0.7, 0.8])
+
+def draw_labels(rng, labels, size, thresholds=None):
+    """Draw `size` labels uniformly, or weighted by cumulative `thresholds`."""
+    if thresholds is None:
+        return labels[rng.integers(0, len(labels), size)]
+    return labels[np.searchsorted(thresholds, rng.random(size), side='right')]
+
+def timestamps_ago(rng, now, low, high, size, unit):
+    """`size` timestamps `low`..`high` units (a numpy timedelta unit) before `now`, as datetime objects."""
+    return (now - rng.integers(low, high, size).astype(f'timedelta64[{unit}]')).tolist()
+
+# The demo data, and the frames and figures cached from it, are st.cache_resource objects:
+# every session gets the same instance, so callers must never mutate them
+@st.cache_resource(show_spinner=False)
 def generate_demo_data():
     """Generate comprehensive demo data for the platform."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
+    now = np.datetime64(datetime.now())
+    ago = partial(timestamps_ago, rng, now)
     
-    # Generate sample datasets
-    datasets = []
-    for i in range(12):
-        datasets.append({
-            'id': f'dataset_{i+1}',
-            'name': f'Dataset {i+1}',
-            'type': np.random.choice(['CSV', 'JSON', 'Parquet', 'Excel']),
-            'size': f"{np.random.randint(1, 500)} MB",
-            'rows': np.random.randint(1000, 100000),
-            'columns': np.random.randint(5, 50),
-            'created': datetime.now() - timedelta(days=np.random.randint(1, 365)),
-            'status': np.random.choice(['Active', 'Processing', 'Archived'], p=[0.7, 0.2, 0.1])
-        })
+    # Generate sample datasets (column lists first; row records are independent dict copies built from them)
+    n = 12
+    dataset_columns = {
+        'id': [f'dataset_{i+1}' for i in range(n)],
+        'name': [f'Dataset {i+1}' for i in range(n)],
+        'type': draw_labels(rng, FILE_TYPES, n).tolist(),
+        'size': [f"{size} MB" for size in rng.integers(1, 500, n).tolist()],
+        'rows': rng.integers(1000, 100000, n).tolist(),
+        'columns': rng.integers(5, 50, n).tolist(),
+        'created': ago(1, 365, n, 'D'),
+        'status': draw_labels(rng, DATASET_STATUSES, n, DATASET_STATUS_THRESHOLDS).tolist()
+    }
     
     # Generate ML models
-    models = []
-    model_types = ['Classification', 'Regression', 'Clustering', 'Deep Learning', 'Time Series']
-    for i in range(8):
-        models.append({
-            'id': f'model_{i+1}',
-            'name': f'Model {i+1}',
-            'type': np.random.choice(model_types),
-            'accuracy': np.random.uniform(0.75, 0.98),
-            'status': np.random.choice(['Training', 'Deployed', 'Failed', 'Completed'], p=[0.2, 0.5, 0.1, 0.2]),
-            'created': datetime.now() - timedelta(days=np.random.randint(1, 180)),
-            'dataset': f'Dataset {np.random.randint(1, 12)}'
-        })
+    n = 8
+    model_status = draw_labels(rng, MODEL_STATUSES, n, MODEL_STATUS_THRESHOLDS)
+    model_types = draw_labels(rng, MODEL_TYPES, n)
+    model_columns = {
+        'id': [f'model_{i+1}' for i in range(n)],
+        'name': [f'Model {i+1}' for i in range(n)],
+        'type': model_types.tolist(),
+        'accuracy': rng.uniform(0.75, 0.98, n).tolist(),
+        'status': model_status.tolist(),
+        'created': ago(1, 180, n, 'D'),
+        'dataset': [f'Dataset {dataset}' for dataset in rng.integers(1, 12, n).tolist()]
+    }
     
     # Generate dashboards
-    dashboards = []
-    for i in range(6):
-        dashboards.append({
-            'id': f'dashboard_{i+1}',
-            'name': f'Analytics Dashboard {i+1}',
-            'widgets': np.random.randint(3, 12),
-            'views': np.random.randint(100, 5000),
-            'last_updated': datetime.now() - timedelta(hours=np.random.randint(1, 48)),
-            'status': 'Active'
-        })
+    n = 6
+    dashboard_columns = {
+        'id': [f'dashboard_{i+1}' for i in range(n)],
+        'name': [f'Analytics Dashboard {i+1}' for i in range(n)],
+        'widgets': rng.integers(3, 12, n).tolist(),
+        'views': rng.integers(100, 5000, n).tolist(),
+        'last_updated': ago(1, 48, n, 'h'),
+        'status': ['Active'] * n
+    }
+    
+    models = records_from_columns(model_columns)
     
     return {
-        'datasets': datasets,
+        'datasets': records_from_columns(dataset_columns),
         'models': models,
-        'dashboards': dashboards,
+        'dashboards': records_from_columns(dashboard_columns),
+        'columns': {
+            'datasets': dataset_columns,
+            'models': model_columns,
+            'dashboards': dashboard_columns
+        },
+        # Aggregates derived once here instead of on every rerun
+        'precomputed': {
+            'model_types_sorted': np.unique(model_types).tolist(),
+            'models_by_status': {
+                status: [model for model, is_status in zip(models, model_status == status) if is_status]
+                for status in MODEL_STATUSES.tolist()
+            }
+        },
         'metrics': {
-            'total_datasets': len(datasets),
-            'active_models': len([m for m in models if m['status'] == 'Deployed']),
-            'total_dashboards': len(dashboards),
-            'data_processed': f"{np.random.randint(50, 500)} GB",
-            'api_calls_today': np.random.randint(1000, 10000),
+            'total_datasets': len(dataset_columns['id']),
+            'active_models': int(np.count_nonzero(model_status == 'Deployed')),
+            'total_dashboards': len(dashboard_columns['id']),
+            'data_processed': f"{rng.integers(50, 500)} GB",
+            'api_calls_today': int(rng.integers(1000, 10000)),
             'uptime': "99.9%"
         }
-    }
\ No newline at end of file
+    }
+
+def records_from_columns(columns):
+    """Row records (one dict per row) for a dict of equal-length column lists."""
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+@st.cache_resource(show_spinner=False)
+def demo_columns_frame(kind, record_ids, _columns):
+    """DataFrame of a demo column set, memoized on its record ids."""
+    return pd.DataFrame(_columns)
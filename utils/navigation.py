@@ -3,49 +3,57 @@
 Navigation and routing helper functions
 """
 
+import time
+from functools import lru_cache
 import streamlit as st
 
+# Seconds between integration/OAuth status probes per session
+_STATUS_TTL = 30
+
+# Sidebar mode banners (heading, message)
+_DEMO_BANNER = (
+    "### Demo Mode",
+    "Running in demo mode with sample data. Deploy with backend services for full functionality."
+)
+_PROD_BANNER = ("### Production Mode", "Running with production integrations!")
+
+# User experience levels: key -> selector label
+_LEVELS = {
+    'Beginner': 'Beginner - Guided tutorials and simple interfaces',
+    'Intermediate': 'Intermediate - More features and customization',
+    'Advanced': 'Advanced - Full platform capabilities'
+}
+_LEVEL_KEYS = tuple(_LEVELS)
+_LEVEL_INDEX = {level: i for i, level in enumerate(_LEVEL_KEYS)}
+
+# Navigation options per user level (unknown levels get the base menu)
+_NAV_BASE = ("Dashboard", "Data Management", "ML Studio", "Analytics")
+_NAV_BY_LEVEL = {
+    'Beginner': _NAV_BASE,
+    'Intermediate': _NAV_BASE + ("Data Pipelines", "Model Registry"),
+    'Advanced': _NAV_BASE + (
+        "Data Pipelines",
+        "Model Registry",
+        "API Management",
+        "System Monitoring",
+        "User Management",
+        "Platform Settings"
+    )
+}
+
 def get_navigation_options(user_level):
     """Get navigation options based on user level."""
-    base_options = [
-        "Dashboard",
-        "Data Management",
-        "ML Studio",
-        "Analytics"
-    ]
-    
-    if user_level == 'Intermediate':
-        base_options.extend([
-            "Data Pipelines",
-            "Model Registry"
-        ])
-    elif user_level == 'Advanced':
-        base_options.extend([
-            "Data Pipelines",
-            "Model Registry",
-            "API Management",
-            "System Monitoring",
-            "User Management",
-            "Platform Settings"
-        ])
-    
-    return base_options
+    return _NAV_BY_LEVEL.get(user_level, _NAV_BASE)
 
 def show_user_level_selector():
     """Show user experience level selector."""
     st.sidebar.markdown("### User Experience Level")
     
-    levels = {
-        'Beginner': 'Beginner - Guided tutorials and simple interfaces',
-        'Intermediate': 'Intermediate - More features and customization',
-        'Advanced': 'Advanced - Full platform capabilities'
-    }
-    
     selected_level = st.sidebar.selectbox(
         "Choose your experience level:",
-        options=list(levels.keys()),
-        index=list(levels.keys()).index(st.session_state.user_level),
-        format_func=lambda x: levels[x]
+        options=_LEVEL_KEYS,
+        index=_LEVEL_INDEX[st.session_state.user_level],
+        format_func=_LEVELS.__getitem__
     )
     
     if selected_level != st.session_state.user_level:
@@ -54,30 +62,49 @@ def show_user_level_selector():
     
     return selected_level
 
+@lru_cache(maxsize=8)
+def _integration_markdown(database, storage, local_storage):
+    """Build the sidebar integration block for a (database, storage, local) flag combination."""
+    integrations = (
+        ("Database", '✓ Connected' if database else 'Demo Mode'),
+        ("Storage", '✓ Connected' if storage else 'Demo Mode'),
+        ("Local Storage", '✓ Available' if local_storage else '✗ Unavailable')
+    )
+    return "\n\n".join(f"{service}: {status_text}" for service, status_text in integrations)
+
+def _probe_integrations(auth_manager):
+    """Return integration and OAuth flags, re-probed at most every _STATUS_TTL seconds."""
+    now = time.monotonic()
+    if now - st.session_state.get('_status_probed_at', 0) > _STATUS_TTL:
+        status = auth_manager.get_integration_status()
+        database, storage, local_storage = status.get('supabase'), status.get('cloudinary'), status.get('local_storage')
+        github_configured = st.secrets.get("GITHUB_CLIENT_ID", "").replace("your-github-client-id-here", "") != ""
+        google_configured = st.secrets.get("GOOGLE_CLIENT_ID", "").replace("your-google-client-id-here", "") != ""
+        st.session_state._status_probe = (
+            bool(database), bool(storage), bool(local_storage), github_configured, google_configured
+        )
+        st.session_state._status_probed_at = now
+    return st.session_state._status_probe
+
 def show_sidebar_status(auth_manager=None):
     """Show sidebar status information."""
     # Platform status
-    st.sidebar.markdown("### Platform Status")
-    st.sidebar.markdown("✓ All Systems Operational")
-    st.sidebar.markdown(f"Uptime: 99.9%")
-    
     from datetime import datetime
-    st.sidebar.markdown(f"Last Updated: {datetime.now().strftime('%H:%M:%S')}")
+    st.sidebar.markdown(
+        "### Platform Status\n\n✓ All Systems Operational\n\nUptime: 99.9%\n\n"
+        f"Last Updated: {datetime.now().strftime('%H:%M:%S')}"
+    )
     
     # Production integration status
     if auth_manager:
-        status = auth_manager.get_integration_status()
-        st.sidebar.markdown("### Integrations")
-        st.sidebar.markdown(f"Database: {'✓ Connected' if status['supabase'] else 'Demo Mode'}")
-        st.sidebar.markdown(f"Storage: {'✓ Connected' if status['cloudinary'] else 'Demo Mode'}")
-        st.sidebar.markdown(f"Local Storage: {'✓ Available' if status['local_storage'] else '✗ Unavailable'}")
-        
-        # OAuth status
-        github_configured = st.secrets.get("GITHUB_CLIENT_ID", "").replace("your-github-client-id-here", "") != ""
-        google_configured = st.secrets.get("GOOGLE_CLIENT_ID", "").replace("your-google-client-id-here", "") != ""
+        database, storage, local_storage, github_configured, google_configured = _probe_integrations(auth_manager)
         
-        st.sidebar.markdown(f"GitHub OAuth: {'✓ Configured' if github_configured else 'Setup Required'}")
-        st.sidebar.markdown(f"Google OAuth: {'✓ Configured' if google_configured else 'Setup Required'}")
+        # Integrations and OAuth status in one block
+        st.sidebar.markdown(
+            f"### Integrations\n\n{_integration_markdown(database, storage, local_storage)}\n\n"
+            f"GitHub OAuth: {'✓ Configured' if github_configured else 'Setup Required'}\n\n"
+            f"Google OAuth: {'✓ Configured' if google_configured else 'Setup Required'}"
+        )
         
         if not github_configured or not google_configured:
             missing = []
@@ -88,8 +115,8 @@ def show_sidebar_status(auth_manager=None):
     # Demo mode indicator
     DEMO_MODE = st.secrets.get("DEMO_MODE", "true").lower() == "true"
     if DEMO_MODE:
-        st.sidebar.markdown("### Demo Mode")
-        st.sidebar.info("Running in demo mode with sample data. Deploy with backend services for full functionality.")
+        st.sidebar.markdown(_DEMO_BANNER[0])
+        st.sidebar.info(_DEMO_BANNER[1])
     else:
-        st.sidebar.markdown("### Production Mode")
-        st.sidebar.success("Running with production integrations!")
\ No newline at end of file
+        st.sidebar.markdown(_PROD_BANNER[0])
+        st.sidebar.success(_PROD_BANNER[1])
\ No newline at end of file